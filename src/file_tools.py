@@ -1,11 +1,17 @@
 import os
-import shutil
-from pathlib import Path
-import subprocess
-from datetime import datetime
-from typing import List, Dict, Set, Optional
+import re
+import stat
+import sys
+from typing import TYPE_CHECKING, List, Dict, Set, Optional, Union
 import logging
 import argparse
+# shutil, subprocess, datetime and asyncio (the heaviest by far) are imported
+# inside the methods that need them, so --help and --tree start up faster
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+
+if TYPE_CHECKING:
+    import asyncio
 
 class Colors:
     """Because ANSI codes are just spicy strings."""
@@ -21,7 +27,7 @@ class Colors:
 class FileTools:
     """Because sometimes you need to clean house, and your house is full of code."""
     
-    COMMON_IGNORED_DIRS = {
+    COMMON_IGNORED_DIRS = frozenset({
         'node_modules',
         'dist',
         'build',
@@ -38,7 +44,7 @@ class FileTools:
         '.task',
         '.next',
         '.nuxt',
-    }
+    })
 
     # Size thresholds for color coding (in bytes)
     SIZE_THRESHOLDS = {
@@ -48,10 +54,36 @@ class FileTools:
         50_000_000: (Colors.CYAN, "😌"),        # 50MB+
         0: (Colors.GREEN, "😊"),                # Everything else
     }
+    _SORTED_THRESHOLDS = tuple(sorted(SIZE_THRESHOLDS.items(), reverse=True))
+    # Pre-baked '{value}{unit}' templates so formatting a size is a single str.format
+    _SIZE_TEMPLATES = tuple(
+        (threshold, f"{color}{{:.1f}}{{}} {emoji}{Colors.RESET}")
+        for threshold, (color, emoji) in _SORTED_THRESHOLDS
+    )
+    _DEFAULT_SIZE_TEMPLATE = f"{Colors.CYAN}{{:.1f}}{{}} 😊{Colors.RESET}"
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+    # git subprocesses are I/O-bound, so run a few more than we have cores
+    MAX_GIT_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+    # git status runs on an event loop, so it can go much wider than a thread pool
+    MAX_GIT_STATUS_PROCS = 64
+    STATUS_PREVIEW_BYTES = 4096
+
+    # Just enough .git/config parsing to flip core.filemode without spawning git
+    _SECTION_RE = re.compile(r'^[ \t]*\[', re.MULTILINE)
+    _CORE_SECTION_RE = re.compile(r'^[ \t]*\[core\][ \t]*\n', re.MULTILINE | re.IGNORECASE)
+    # Matches the bare `filemode` form (which git reads as true) as well as `filemode = value`
+    _FILEMODE_RE = re.compile(
+        r'^[ \t]*filemode(?=[ \t]*(?:[=;#\n]|$))(?:[ \t]*=[ \t]*([^\s;#]*))?[^\n]*',
+        re.MULTILINE | re.IGNORECASE
+    )
+    _FALSE_VALUES = frozenset({'false', 'no', 'off', '0'})
 
     def __init__(self):
         self.current_dir = os.environ.get('CURRENT_DIR', os.getcwd())
         self.logger = self._setup_logger()
+        self._size_cache: Dict[tuple[int, int, int], int] = {}
+        self._tree_scan: Optional[tuple[Dict[str, int], Dict[str, List[tuple[str, str]]], List[str]]] = None
 
     def _setup_logger(self) -> logging.Logger:
         logger = logging.getLogger('FileTools')
@@ -62,111 +94,336 @@ class FileTools:
         logger.addHandler(handler)
         return logger
 
-    def _get_dir_size(self, path: Path) -> int:
-        """Calculate directory size in bytes."""
-        return sum(f.stat().st_size for f in path.glob('**/*') if f.is_file())
-
-    def _get_size_color(self, size: int) -> tuple[str, str]:
-        """Get the appropriate color and emoji for a given size."""
-        for threshold, (color, emoji) in sorted(self.SIZE_THRESHOLDS.items(), reverse=True):
+    def _get_dir_size(self, path: Union[str, os.PathLike]) -> int:
+        """Calculate directory size in bytes.
+
+        Uses os.fwalk where the platform has it so every file is stat'ed relative
+        to its already-open directory fd; falls back to an os.scandir walk
+        elsewhere (Windows). Results are cached by (device, inode, mtime) so the
+        same directory reached through a different path spelling is only walked once.
+        """
+        path = os.fspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0  # gone or unreadable, nothing to count
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        cached = self._size_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if hasattr(os, 'fwalk'):
+            total = self._fwalk_size(path)
+        else:
+            total = self._scandir_size(path)
+        self._size_cache[key] = total
+        return total
+
+    def _fwalk_size(self, path: str) -> int:
+        """Sum regular file sizes under path using fd-relative stats."""
+        total = 0
+        for _, _, files, dirfd in os.fwalk(path, follow_symlinks=False):
+            for name in files:
+                try:
+                    st = os.stat(name, dir_fd=dirfd, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    total += st.st_size
+        return total
+
+    def _scandir_size(self, path: str) -> int:
+        """Sum regular file sizes under path, reading type and size off each DirEntry."""
+        total = 0
+        stack = [path]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        return total
+
+    def _get_size_template(self, size: int) -> str:
+        """Get the colored format template for a given size."""
+        for threshold, template in self._SIZE_TEMPLATES:
             if size >= threshold:
-                return color, emoji
-        return Colors.CYAN, "😊"  # Default
+                return template
+        return self._DEFAULT_SIZE_TEMPLATE
 
     def _format_size(self, size: int) -> str:
         """Convert bytes to human readable format with color."""
-        color, emoji = self._get_size_color(size)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{color}{size:.1f}{unit} {emoji}{Colors.RESET}"
-            size /= 1024
-        return f"{color}{size:.1f}TB {emoji}{Colors.RESET}"
-
-    def list_subdirs(self, max_depth: int = 2) -> None:
-        """List all subdirectories up to specified depth with their sizes, sorted by size (descending)."""
-        root = Path(self.current_dir)
-        
-        def get_dir_info(path: Path) -> tuple[int, str]:
-            """Get directory size and name as a sortable tuple."""
-            return (self._get_dir_size(path), path.name)
-        
-        def print_tree(path: Path, depth: int = 0) -> None:
+        # Every 10 bits is one unit step, so read the unit straight off the bit length
+        idx = min((size.bit_length() - 1) // 10, len(self.SIZE_UNITS) - 1) if size > 0 else 0
+        return self._get_size_template(size).format(size / (1 << (10 * idx)), self.SIZE_UNITS[idx])
+
+    def _compute_sizes(self, root: str) -> tuple[Dict[str, int], Dict[str, List[tuple[str, str]]], List[str]]:
+        """Size every directory under root in a single post-order walk.
+
+        Returns (sizes, children, repos): sizes maps each directory path to its total
+        size in bytes, children maps it to its (name, path) subdirectories, and repos lists every
+        directory that holds a .git entry (outside COMMON_IGNORED_DIRS).
+        """
+        sizes: Dict[str, int] = {}
+        children: Dict[str, List[tuple[str, str]]] = {}
+        repos: List[str] = []
+        ignored = self.COMMON_IGNORED_DIRS
+
+        def walk(path: str, in_ignored: bool = False) -> int:
+            total = 0
+            subdirs: List[tuple[str, str]] = []
+            try:
+                it = os.scandir(path)
+            except OSError:
+                sizes[path] = 0
+                children[path] = subdirs
+                return 0
+            with it:
+                for entry in it:
+                    try:
+                        if entry.name == '.git' and not in_ignored:
+                            repos.append(path)
+                        if entry.is_dir(follow_symlinks=False):
+                            total += walk(entry.path, in_ignored or entry.name in ignored)
+                            subdirs.append((entry.name, entry.path))
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+            sizes[path] = total
+            children[path] = subdirs
+            return total
+
+        walk(root)
+        return sizes, children, repos
+
+    def _scan_tree(self) -> tuple[Dict[str, int], Dict[str, List[tuple[str, str]]], List[str]]:
+        """Run _compute_sizes over the current dir once and share it with later actions."""
+        if self._tree_scan is None:
+            self._tree_scan = self._compute_sizes(self.current_dir)
+        return self._tree_scan
+
+    def list_subdirs(self, max_depth: int = 2, skip: Optional[frozenset] = None) -> None:
+        """List all subdirectories up to specified depth with their sizes, sorted by size (descending).
+
+        Directories named in skip (COMMON_IGNORED_DIRS by default) are left out of the
+        listing, like hidden ones, but still count towards their parent's size.
+        """
+        if skip is None:
+            skip = self.COMMON_IGNORED_DIRS
+        # abspath so '.', './' and a trailing slash still give the directory's real name
+        root_name = os.path.basename(os.path.abspath(self.current_dir))
+
+        # The formatter is just '%(message)s', so skip logging's per-record overhead
+        # and write the whole tree to stdout in one go
+        lines: List[str] = [
+            f"\n{Colors.GREEN}Directory Tree{Colors.RESET} (max depth: {max_depth}, sorted by size):"
+        ]
+        if root_name[:1] == '.':
+            # A hidden root gets the header and nothing else, without sizing the tree
+            lines.append('')
+            sys.stdout.write('\n'.join(lines))
+            sys.stdout.flush()
+            return
+
+        sizes, children, _ = self._scan_tree()
+
+        # Hoisted out of the per-directory recursion
+        fmt = self._format_size
+        emit = lines.append
+
+        def print_tree(path: str, name: str, depth: int = 0) -> None:
             if depth > max_depth:
                 return
-            
-            if path.is_dir() and not path.name.startswith('.'):
-                size = self._get_dir_size(path)
-                indent = "  " * depth
-                prefix = f"{Colors.BLUE}└──{Colors.RESET}" if depth > 0 else ""
-                name_color = Colors.CYAN if depth == 0 else Colors.WHITE
-                self.logger.info(f"{indent}{prefix} {name_color}{path.name}/{Colors.RESET} ({self._format_size(size)})")
-                
-                subdirs = [
-                    (p, get_dir_info(p)) 
-                    for p in path.iterdir() 
-                    if p.is_dir() and not p.name.startswith('.')
-                ]
-                
-                sorted_subdirs = sorted(
-                    subdirs,
-                    key=lambda x: (-x[1][0], x[1][1])  # -size for descending, name for ties
-                )
-                
-                for subdir, _ in sorted_subdirs:
-                    print_tree(subdir, depth + 1)
 
-        self.logger.info(f"\n{Colors.GREEN}Directory Tree{Colors.RESET} (max depth: {max_depth}, sorted by size):")
-        print_tree(root)
+            indent = "  " * depth
+            prefix = f"{Colors.BLUE}└──{Colors.RESET}" if depth > 0 else ""
+            name_color = Colors.CYAN if depth == 0 else Colors.WHITE
+            emit(f"{indent}{prefix} {name_color}{name}/{Colors.RESET} ({fmt(sizes[path])})")
 
-    def find_ignored_dirs(self, dry_run: bool = True) -> None:
-        """Find all commonly ignored directories."""
-        root = Path(self.current_dir)
-        found_dirs: List[Path] = []
+            sorted_subdirs = sorted(
+                (child for child in children[path] if child[0][:1] != '.' and child[0] not in skip),
+                key=lambda child: (-sizes[child[1]], child[0])  # -size for descending, name for ties
+            )
 
-        for ignored_dir in self.COMMON_IGNORED_DIRS:
-            found_dirs.extend(root.glob(f'**/{ignored_dir}'))
+            for subdir_name, subdir in sorted_subdirs:
+                print_tree(subdir, subdir_name, depth + 1)
 
-        total_size = sum(self._get_dir_size(d) for d in found_dirs)
+        print_tree(self.current_dir, root_name)
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()  # keep ordering with the logger's stderr output
+
+    def find_ignored_dirs(self, dry_run: bool = True) -> None:
+        """Find all commonly ignored directories."""
+        found_dirs: List[str] = []
+        ignored = self.COMMON_IGNORED_DIRS
+
+        if self._tree_scan is not None:
+            # The tree has already been walked, so just read the hits off it
+            scanned_sizes, children, _ = self._tree_scan
+            stack = [self.current_dir]
+            while stack:
+                for name, subdir in children[stack.pop()]:
+                    if name in ignored:
+                        found_dirs.append(subdir)
+                    else:
+                        stack.append(subdir)
+            size_of = scanned_sizes.__getitem__
+        else:
+            stack = [self.current_dir]
+            while stack:
+                try:
+                    it = os.scandir(stack.pop())
+                except OSError:
+                    continue
+                with it:
+                    for entry in it:
+                        try:
+                            # Symlinked dirs aren't ours to size or delete
+                            if not entry.is_dir(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        if entry.name in ignored:
+                            found_dirs.append(entry.path)  # flagged, so no need to look inside
+                        else:
+                            stack.append(entry.path)
+            size_of = self._get_dir_size
+
+        # Sort once, then size, total and format in a single pass over the list
+        found_dirs.sort()
+        total_size = 0
+        lines: List[str] = []
+        for dir_path in found_dirs:
+            size = size_of(dir_path)
+            total_size += size
+            lines.append(f"{Colors.BLUE}•{Colors.RESET} {dir_path} ({self._format_size(size)})")
         
         self.logger.info(f"\n{Colors.YELLOW}Found potentially removable directories:{Colors.RESET}")
-        for dir_path in sorted(found_dirs):
-            size = self._get_dir_size(dir_path)
-            self.logger.info(f"{Colors.BLUE}•{Colors.RESET} {dir_path} ({self._format_size(size)})")
+        if lines:
+            self.logger.info('\n'.join(lines))
         
         self.logger.info(f"\n{Colors.MAGENTA}Total space used: {self._format_size(total_size)}{Colors.RESET}")
         
         if not dry_run:
+            import shutil
+
             self.logger.info(f"\n{Colors.RED}Deleting directories...{Colors.RESET}")
-            for dir_path in found_dirs:
+            # The found dirs never nest, so their trees can be removed side by side
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                futures = {executor.submit(shutil.rmtree, d): d for d in found_dirs}
+                for future in as_completed(futures):
+                    dir_path = futures[future]
+                    try:
+                        future.result()
+                        self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Deleted {dir_path}")
+                    except Exception as e:
+                        self.logger.error(f"{Colors.RED}✗{Colors.RESET} Failed to delete {dir_path}: {str(e)}")
+            # Anything we sized or scanned before is stale now
+            self._size_cache.clear()
+            self._tree_scan = None
+            self.__dict__.pop('repo_paths', None)
+
+    @cached_property
+    def repo_paths(self) -> List[str]:
+        """Git repos under the current dir, discovered once and reused by every git action."""
+        return self._find_git_repos()
+
+    def _find_git_repos(self) -> List[str]:
+        """Find every git repo under the current dir, skipping .git and COMMON_IGNORED_DIRS."""
+        if self._tree_scan is not None:
+            return self._tree_scan[2]
+
+        repos: List[str] = []
+        ignored = self.COMMON_IGNORED_DIRS
+        stack = [self.current_dir]
+        while stack:
+            path = stack.pop()
+            try:
+                it = os.scandir(path)
+            except OSError:
+                continue
+            subdirs: List[str] = []
+            with it:
+                for entry in it:
+                    # Never walk git internals or vendored/build trees looking for repos
+                    if entry.name == '.git':
+                        repos.append(path)
+                    elif entry.name not in ignored:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            pass
+            stack.extend(reversed(subdirs))
+        return repos
+
+    async def _status_preview(self, repo_path: str, limit: 'asyncio.Semaphore', include_untracked: bool = True):
+        """Read the first STATUS_PREVIEW_BYTES of a repo's porcelain status."""
+        import asyncio
+
+        untracked_flag = '-unormal' if include_untracked else '-uno'
+        async with limit:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    'git', '-C', repo_path, '--no-optional-locks', 'status', '--porcelain', '-z', untracked_flag,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            except OSError as e:
+                return repo_path, e
+
+            preview = b''
+            while len(preview) < self.STATUS_PREVIEW_BYTES:
+                chunk = await proc.stdout.read(self.STATUS_PREVIEW_BYTES - len(preview))
+                if not chunk:
+                    break
+                preview += chunk
+            else:
+                # Got our preview; no need to let git list every dirty path
+                # (--no-optional-locks means it isn't holding index.lock)
                 try:
-                    shutil.rmtree(dir_path)
-                    self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Deleted {dir_path}")
-                except Exception as e:
-                    self.logger.error(f"{Colors.RED}✗{Colors.RESET} Failed to delete {dir_path}: {str(e)}")
-
-    def find_uncommitted_changes(self) -> Dict[str, str]:
-        """Find all git repositories with uncommitted changes."""
-        root = Path(self.current_dir)
+                    proc.terminate()
+                except ProcessLookupError:
+                    pass
+            await proc.wait()
+            return repo_path, preview.decode(errors='replace')
+
+    async def _status_all(self, repo_paths: List[str], include_untracked: bool = True):
+        """Fan git status out over every repo at once, MAX_GIT_STATUS_PROCS at a time."""
+        import asyncio
+
+        limit = asyncio.Semaphore(self.MAX_GIT_STATUS_PROCS)
+        return await asyncio.gather(*(self._status_preview(p, limit, include_untracked) for p in repo_paths))
+
+    def find_uncommitted_changes(self, include_untracked: bool = True) -> Dict[str, str]:
+        """Find all git repositories with uncommitted changes.
+
+        Maps each dirty repo to the start of its `git status --porcelain -z` output;
+        only STATUS_PREVIEW_BYTES are read, which is plenty for a preview. With
+        include_untracked=False, repos whose only changes are untracked files count as clean.
+        """
+        import asyncio
+
         repos_with_changes: Dict[str, str] = {}
 
         self.logger.info(f"\n{Colors.YELLOW}Scanning for uncommitted changes...{Colors.RESET}")
         
-        for git_dir in root.glob('**/.git'):
-            repo_path = git_dir.parent
-            try:
-                result = subprocess.run(
-                    ['git', 'status', '--porcelain'],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.stdout.strip():
-                    repos_with_changes[str(repo_path)] = result.stdout
-                    self.logger.info(f"{Colors.RED}•{Colors.RESET} Changes found in: {Colors.CYAN}{repo_path}{Colors.RESET}")
-            
-            except subprocess.SubprocessError as e:
-                self.logger.error(f"{Colors.RED}Error checking {repo_path}: {str(e)}{Colors.RESET}")
+        for repo_path, result in asyncio.run(self._status_all(self.repo_paths, include_untracked)):
+            if isinstance(result, OSError):
+                self.logger.error(f"{Colors.RED}Error checking {repo_path}: {str(result)}{Colors.RESET}")
+            elif result:
+                repos_with_changes[repo_path] = result
+                self.logger.info(f"{Colors.RED}•{Colors.RESET} Changes found in: {Colors.CYAN}{repo_path}{Colors.RESET}")
 
         if not repos_with_changes:
             self.logger.info(f"{Colors.GREEN}No uncommitted changes found. You're squeaky clean! 🧼{Colors.RESET}")
@@ -184,8 +441,10 @@ class FileTools:
         self.logger.info(f"{Colors.YELLOW}Enter numbers (space-separated), 'all', or 'none'. Press Enter to commit everything.{Colors.RESET}\n")
 
         for idx, repo in enumerate(repos_list, 1):
-            status_preview = repos_with_changes[repo].split('\n')[0].strip()
-            if len(repos_with_changes[repo].split('\n')) > 1:
+            # porcelain -z entries are NUL-terminated, so only peel off the first one
+            first, _, rest = repos_with_changes[repo].partition('\x00')
+            status_preview = first.strip()
+            if rest:
                 status_preview += " ..."
             self.logger.info(f"{Colors.GREEN}{idx}{Colors.RESET}. {repo} | sample: {Colors.YELLOW}Changes: {status_preview}{Colors.RESET}")
 
@@ -221,9 +480,41 @@ class FileTools:
             except (ValueError, IndexError):
                 self.logger.info(f"{Colors.RED}Invalid input. Please use numbers separated by spaces.{Colors.RESET}")
 
-    def commit_all_changes(self, interactive: bool = True) -> None:
-        """Commit all changes in repositories with uncommitted work."""
-        repos_with_changes = self.find_uncommitted_changes()
+    @staticmethod
+    def _git_error(error: Exception) -> str:
+        """Describe a failed git call using git's own message rather than just its exit status."""
+        output = getattr(error, 'stderr', None) or getattr(error, 'output', None)
+        if output:
+            if isinstance(output, bytes):
+                output = output.decode(errors='replace')
+            output = output.strip()
+            if output:
+                return f"{error}\n{output}"
+        return str(error)
+
+    def _add_and_commit(self, repo_path: str, commit_msg: str, include_untracked: bool = True):
+        """Stage and commit one repo; runs inside a pool worker so repos commit side by side."""
+        import subprocess
+
+        try:
+            if include_untracked:
+                subprocess.run(['git', '-C', repo_path, 'add', '-A'], check=True, capture_output=True)
+                subprocess.run(['git', '-C', repo_path, 'commit', '-m', commit_msg, '--no-verify'], check=True, capture_output=True)
+            else:
+                subprocess.run(['git', '-C', repo_path, 'commit', '-a', '-m', commit_msg, '--no-verify'], check=True, capture_output=True)
+            return repo_path, None
+        except subprocess.SubprocessError as e:
+            # Output is captured so parallel commits don't interleave; keep git's reason
+            return repo_path, self._git_error(e)
+
+    def commit_all_changes(self, interactive: bool = True, include_untracked: bool = True) -> None:
+        """Commit all changes in repositories with uncommitted work.
+
+        With include_untracked=False only tracked files are committed, via a single
+        `git commit -a` instead of an add + commit pair.
+        """
+        # `git commit -a` has nothing to do in a repo that only has untracked files
+        repos_with_changes = self.find_uncommitted_changes(include_untracked)
         
         if not repos_with_changes:
             return
@@ -237,41 +528,106 @@ class FileTools:
             self.logger.info(f"{Colors.YELLOW}No repositories selected for commit.{Colors.RESET}")
             return
 
+        from datetime import datetime
+
         date_str = datetime.now().strftime('%Y%m%d')
         commit_msg = f"{date_str} commit for transfer"
 
         self.logger.info(f"\n{Colors.YELLOW}Committing changes...{Colors.RESET}")
-        
-        for repo_path in repos_to_commit:
-            try:
-                subprocess.run(['git', 'add', '-A'], cwd=repo_path, check=True)
-                subprocess.run(['git', 'commit', '-m', commit_msg, '--no-verify'], cwd=repo_path, check=True)
-                self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Committed changes in {Colors.CYAN}{repo_path}{Colors.RESET}")
-            
-            except subprocess.SubprocessError as e:
-                self.logger.error(f"{Colors.RED}✗ Failed to commit changes in {repo_path}: {str(e)}{Colors.RESET}")
+
+        with ThreadPoolExecutor(max_workers=self.MAX_GIT_WORKERS) as executor:
+            results = executor.map(
+                self._add_and_commit,
+                repos_to_commit,
+                [commit_msg] * len(repos_to_commit),
+                [include_untracked] * len(repos_to_commit)
+            )
+            for repo_path, error in results:
+                if error is None:
+                    self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Committed changes in {Colors.CYAN}{repo_path}{Colors.RESET}")
+                else:
+                    self.logger.error(f"{Colors.RED}✗ Failed to commit changes in {repo_path}: {str(error)}{Colors.RESET}")
+
+    def _write_core_filemode(self, repo_path: str) -> None:
+        """Set core.filemode = false by editing .git/config directly, no git process needed.
+
+        Takes config.lock the same way git does and swaps it into place. Raises
+        OSError/ValueError for anything it doesn't want to guess at (a .git file,
+        several [core] sections, a held lock) so the caller can fall back to git.
+        """
+        config_path = os.path.join(repo_path, '.git', 'config')
+        with open(config_path) as f:
+            config = f.read()
+
+        headers = list(self._CORE_SECTION_RE.finditer(config))
+        if len(headers) > 1:
+            raise ValueError(f"multiple [core] sections in {config_path}")
+
+        if not headers:
+            if config and not config.endswith('\n'):
+                config += '\n'
+            config += '[core]\n\tfilemode = false\n'
+        else:
+            body_start = headers[0].end()
+            next_section = self._SECTION_RE.search(config, body_start)
+            body_end = len(config) if next_section is None else next_section.start()
+            body = config[body_start:body_end]
+            # git takes the last filemode line, so that's the only one worth checking
+            existing = None
+            for existing in self._FILEMODE_RE.finditer(body):
+                pass
+            if existing is None:
+                if body and not body.endswith('\n'):
+                    body += '\n'
+                body += '\tfilemode = false\n'
+            elif (existing.group(1) or 'true').lower() in self._FALSE_VALUES:
+                return
+            else:
+                body = body[:existing.start()] + '\tfilemode = false' + body[existing.end():]
+            config = config[:body_start] + body + config[body_end:]
+
+        lock_path = config_path + '.lock'
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(config)
+            os.replace(lock_path, config_path)
+        except BaseException:
+            os.unlink(lock_path)
+            raise
 
     def fix_filemode(self) -> None:
         """Because executable bits are like opinions - sometimes it's better to ignore them."""
-        root = Path(self.current_dir)
+        import subprocess
+
         fixed_count = 0
         
         self.logger.info(f"\n{Colors.YELLOW}Fixing file mode settings in git repos...{Colors.RESET}")
         
-        for git_dir in root.glob('**/.git'):
-            repo_path = git_dir.parent
+        def set_filemode(repo_path: str):
+            try:
+                self._write_core_filemode(repo_path)
+                return repo_path, None
+            except (OSError, ValueError):
+                pass  # let git sort it out
+
             try:
                 subprocess.run(
-                    ['git', 'config', 'core.filemode', 'false'],
-                    cwd=repo_path,
+                    ['git', '-C', repo_path, 'config', 'core.filemode', 'false'],
                     check=True,
                     capture_output=True
                 )
-                self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Fixed filemode in: {Colors.CYAN}{repo_path}{Colors.RESET}")
-                fixed_count += 1
-                
+                return repo_path, None
             except subprocess.SubprocessError as e:
-                self.logger.error(f"{Colors.RED}✗ Failed to fix filemode in {repo_path}: {str(e)}{Colors.RESET}")
+                return repo_path, self._git_error(e)
+
+        with ThreadPoolExecutor(max_workers=self.MAX_GIT_WORKERS) as executor:
+            for repo_path, error in executor.map(set_filemode, self.repo_paths):
+                if error is None:
+                    self.logger.info(f"{Colors.GREEN}✓{Colors.RESET} Fixed filemode in: {Colors.CYAN}{repo_path}{Colors.RESET}")
+                    fixed_count += 1
+                else:
+                    self.logger.error(f"{Colors.RED}✗ Failed to fix filemode in {repo_path}: {str(error)}{Colors.RESET}")
 
 def main():
     """CLI entry point for our file management salvation."""
@@ -289,6 +645,11 @@ def main():
         default=2,
         help='Maximum depth for directory tree (default: 2)'
     )
+    parser.add_argument(
+        '--show-ignored',
+        action='store_true',
+        help='Include commonly ignored directories (node_modules, venv, ...) in the tree'
+    )
     parser.add_argument(
         '--find-ignored', 
         action='store_true', 
@@ -314,6 +675,11 @@ def main():
         action='store_true',
         help='Skip interactive selection for commit-all'
     )
+    parser.add_argument(
+        '--tracked-only',
+        action='store_true',
+        help='Only commit changes to tracked files for commit-all (leaves untracked files alone)'
+    )
     parser.add_argument(
         '--fix-filemode',
         action='store_true',
@@ -322,28 +688,31 @@ def main():
     
     args = parser.parse_args()
     tools = FileTools()
-    
-    if not any(vars(args).values()):
+
+    # Run order matters: --tree goes first so its single walk (sizes + repos) is
+    # shared with whatever else was asked for instead of each action re-walking.
+    actions = {
+        'tree': lambda: tools.list_subdirs(
+            max_depth=args.depth,
+            skip=frozenset() if args.show_ignored else None
+        ),
+        'find_ignored': lambda: tools.find_ignored_dirs(dry_run=True),
+        'delete_ignored': lambda: tools.find_ignored_dirs(dry_run=False),
+        'find_uncommitted': tools.find_uncommitted_changes,
+        'fix_filemode': tools.fix_filemode,
+        'commit_all': lambda: tools.commit_all_changes(
+            interactive=not args.no_interactive,
+            include_untracked=not args.tracked_only
+        ),
+    }
+    requested = [action for flag, action in actions.items() if getattr(args, flag)]
+
+    if not requested:
         parser.print_help()
         return
 
-    if args.tree:
-        tools.list_subdirs(max_depth=args.depth)
-    
-    if args.find_ignored:
-        tools.find_ignored_dirs(dry_run=True)
-    
-    if args.delete_ignored:
-        tools.find_ignored_dirs(dry_run=False)
-    
-    if args.find_uncommitted:
-        tools.find_uncommitted_changes()
-
-    if args.fix_filemode:
-        tools.fix_filemode()
-    
-    if args.commit_all:
-        tools.commit_all_changes(interactive=not args.no_interactive)
+    for action in requested:
+        action()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
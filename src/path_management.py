@@ -1,9 +1,27 @@
 import os
+import re
+import sys
 from pathlib import Path
 import subprocess
 from typing import List
 
+try:
+    import readline  # noqa: F401 - gives input() line editing and history
+except ImportError:
+    pass
+
 class PathManager:
+    MENU = (
+        "Commands:\n"
+        "s - Swap two paths\n"
+        "d - Delete a path\n"
+        "a - Add a path\n"
+        "f - Find PATH modifications in zsh files\n"
+        "w - Which (find executable in PATH)\n"
+        "e - Export current PATH\n"
+        "q - Quit\n"
+    )
+
     def which(self, command):
         """Walk through PATH to find where a command would be found"""
         print(f"\nSearching for '{command}' in PATH:")
@@ -51,6 +69,17 @@ class PathManager:
             Path.home() / '.nvm/nvm.sh',     # NVM initialization
             Path.home() / '.rbenv/version'    # rbenv initialization
         ]
+        # Common PATH modification patterns, folded into one regex
+        self._path_mod_re = re.compile(
+            r'PATH='
+            r'|export\s+PATH'
+            r'|path\+='
+            r'|PATH\+='
+            r'|path=\('
+            r'|\$PATH'
+            r'|\$\{PATH\}'
+            r'|typeset.*PATH'
+        )
 
     def display_paths(self):
         # Find duplicates
@@ -61,13 +90,16 @@ class PathManager:
                 duplicates.add(path)
             seen[path] = True
 
-        print("\nCurrent PATH (in order of precedence):")
+        out = ["\nCurrent PATH (in order of precedence):\n"]
         for i, path in enumerate(self.paths, 1):
             if path in duplicates:
-                print(f"{i}. \033[91m{path} (DUPLICATE)\033[0m")
+                out.append(f"{i}. \033[91m{path} (DUPLICATE)\033[0m\n")
             else:
-                print(f"{i}. {path}")
-        print()
+                out.append(f"{i}. {path}\n")
+        out.append("\n")
+        out.append(self.MENU)
+        # One write per redraw instead of a print per path and menu line
+        sys.stdout.write("".join(out))
 
     def swap_paths(self):
         try:
@@ -116,38 +148,24 @@ class PathManager:
         print("\nSearching for PATH modifications in zsh initialization files...")
         found_any = False
         
-        # Common PATH modification patterns
-        patterns = [
-            'PATH=', 
-            'export PATH', 
-            'path+=', 
-            'PATH+=',
-            'path=(',
-            'PATH=(',
-            '$PATH',
-            '${PATH}',
-            'typeset.*PATH'
-        ]
-        
         for file_path in self.zsh_files:
-            if not file_path.exists():
-                continue
-                
             try:
-                with open(file_path, 'r') as f:
-                    lines = f.readlines()
-                
-                file_has_mods = False
-                for i, line in enumerate(lines, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#'):  # Skip comments
-                        if any(pattern in line for pattern in patterns):
-                            if not file_has_mods:
-                                print(f"\nChecking {file_path}:")
-                                file_has_mods = True
-                            print(f"line {i}: {line}")
-                            found_any = True
+                # open() doubles as the existence check (no separate stat), and the
+                # file is streamed line by line rather than readlines()-ed whole
+                with open(file_path, 'r', buffering=1 << 16) as f:
+                    file_has_mods = False
+                    for i, line in enumerate(f, 1):
+                        line = line.strip()
+                        if line and line[0] != '#':  # Skip comments
+                            if self._path_mod_re.search(line):
+                                if not file_has_mods:
+                                    print(f"\nChecking {file_path}:")
+                                    file_has_mods = True
+                                print(f"line {i}: {line}")
+                                found_any = True
                             
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 print(f"Error reading {file_path}: {e}")
         
@@ -173,14 +191,6 @@ class PathManager:
     def run(self):
         while True:
             self.display_paths()
-            print("Commands:")
-            print("s - Swap two paths")
-            print("d - Delete a path")
-            print("a - Add a path")
-            print("f - Find PATH modifications in zsh files")
-            print("w - Which (find executable in PATH)")
-            print("e - Export current PATH")
-            print("q - Quit")
             
             choice = input("\nEnter command: ").lower().strip()
             
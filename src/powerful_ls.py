@@ -8,5 +8,6 @@ print(f"But lives in: {Path(__file__).parent}")
 print(f"And was ACTUALLY summoned from: {current_dir}")
 
 # Now we're cooking with gas!
-for item in os.listdir(current_dir):
-    print(item)
\ No newline at end of file
+with os.scandir(current_dir) as entries:
+    for entry in entries:
+        print(entry.name)
\ No newline at end of file
@@ -1,21 +1,51 @@
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 current_dir = os.environ.get('CURRENT_DIR')
 
+# Same names as FileTools.COMMON_IGNORED_DIRS; kept local so this script stays
+# standalone and doesn't pay for importing file_tools
+PRUNED_DIRS = frozenset({
+    '.git',
+    'node_modules',
+    'dist',
+    'build',
+    '__pycache__',
+    '.pytest_cache',
+    'target',
+    'vendor',
+    '.gradle',
+    'bin',
+    'obj',
+    '.dart_tool',
+    'venv',
+    '.venv',
+    '.task',
+    '.next',
+    '.nuxt',
+})
+
 def check_uncommitted_changes(repo_path):
-    try:
-        output = subprocess.check_output(
-            ["git", "status", "--porcelain"], cwd=repo_path, text=True
-        )
-        return bool(output.strip())
-    except subprocess.CalledProcessError:
-        return False
+    # A single byte of porcelain output means dirty; closing the pipe after that
+    # lets git quit early instead of listing every changed file
+    with subprocess.Popen(
+        ["git", "-C", repo_path, "--no-optional-locks", "status", "--porcelain", "-z"],
+        stdout=subprocess.PIPE,
+    ) as proc:
+        return bool(proc.stdout.read(1))
 
 
 print(f"Checking for uncommitted changes in {current_dir}")
+repo_paths = []
 for root, dirs, files in os.walk(current_dir):
     if ".git" in dirs:
-        repo_path = os.path.abspath(root)
-        if check_uncommitted_changes(repo_path):
+        repo_paths.append(os.path.abspath(root))
+    # os.walk is top-down, so trimming dirs keeps it out of .git and vendored trees
+    dirs[:] = [d for d in dirs if d not in PRUNED_DIRS]
+
+# git status is mostly waiting on disk, so check repos side by side
+with ThreadPoolExecutor(max_workers=min(32, len(repo_paths) or 1)) as executor:
+    for repo_path, dirty in zip(repo_paths, executor.map(check_uncommitted_changes, repo_paths)):
+        if dirty:
             print(f"Uncommitted changes in {repo_path}")